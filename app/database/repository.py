@@ -1,7 +1,8 @@
+import asyncio
 from datetime import datetime, timedelta
 from typing import Optional, List
 import json
-from sqlalchemy import select, delete, func, desc, and_
+from sqlalchemy import select, delete, func, desc, and_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.price_data import PriceRecord, PriceData
 from app.utils.logger import app_logger as logger
@@ -403,7 +404,6 @@ class PriceRepository:
             logger.info(f"Cleanup batch: deleted {len(ids)} records (total so far: {total_deleted})")
 
             # Yield control to other tasks between batches
-            import asyncio
             await asyncio.sleep(0.5)
 
         if total_deleted > 0:
@@ -411,7 +411,6 @@ class PriceRepository:
 
             # WAL checkpoint to merge WAL back into main DB and reclaim space
             try:
-                from sqlalchemy import text
                 await self.session.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
                 logger.info("WAL checkpoint completed")
             except Exception as e:
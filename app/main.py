@@ -5,6 +5,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import asyncio
 import os
+import time
+from datetime import datetime, timedelta
 
 from app.config import get_settings
 from app.database.connection import get_db_connection, get_db_session
@@ -14,6 +16,7 @@ from app.services.london_fix_client import get_london_fix_client
 from app.services.smbs_client import get_smbs_client
 from app.services.korean_news_client import get_korean_news_client
 from app.services.eodhd_events_client import get_eodhd_events_client
+from app.services.http_session import close_http_session
 from app.routers import api, sse
 from app.utils.logger import app_logger as logger
 from zoneinfo import ZoneInfo
@@ -79,8 +82,6 @@ async def lifespan(app: FastAPI):
 
     # Cache warmup: pre-populate latest-all and reference-prices caches
     async def _cache_warmup():
-        import time
-        from datetime import datetime as dt, timedelta as td
         try:
             await asyncio.sleep(2)  # Wait for DB init
             async for session in get_db_session():
@@ -112,13 +113,13 @@ async def lifespan(app: FastAPI):
                 api._latest_all_cache['expires'] = time.time() + 10  # Longer TTL for warmup
 
                 # Warmup reference-prices cache
-                now_utc = dt.utcnow()
-                kst_today = (now_utc + td(hours=9)).date()
-                today_start_utc = dt(kst_today.year, kst_today.month, kst_today.day, 8, 0) - td(hours=9)
+                now_utc = datetime.utcnow()
+                kst_today = (now_utc + timedelta(hours=9)).date()
+                today_start_utc = datetime(kst_today.year, kst_today.month, kst_today.day, 8, 0) - timedelta(hours=9)
                 lse_close = api._most_recent_close_time_tz(now_utc, 16, 30, ZoneInfo('Europe/London'))
-                lse_search_start = dt(lse_close.year, lse_close.month, lse_close.day, 0, 0)
+                lse_search_start = datetime(lse_close.year, lse_close.month, lse_close.day, 0, 0)
                 nyse_close = api._most_recent_close_time_tz(now_utc, 16, 0, ZoneInfo('America/New_York'))
-                nyse_search_start = dt(nyse_close.year, nyse_close.month, nyse_close.day, 0, 0)
+                nyse_search_start = datetime(nyse_close.year, nyse_close.month, nyse_close.day, 0, 0)
                 ref_assets = [
                     'gold', 'silver', 'platinum', 'palladium', 'usd_krw', 'btc_usd', 'usd_jpy',
                     'usd_cny', 'eur_usd', 'eth_usd', 'copper',
@@ -167,11 +168,17 @@ async def lifespan(app: FastAPI):
     # Stop Events client
     await events_client.stop()
 
+    # Close shared HTTP session (NauGold, SMBS, Twelve Data, EODHD Real-Time)
+    await close_http_session()
+
     # Close database connection
     await db.close_db()
 
     logger.info("Application shutdown complete")
 
+    # Wait for the enqueued log sinks to drain
+    await logger.complete()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -1,6 +1,7 @@
+import time
 from fastapi import APIRouter, Depends, Query, HTTPException
 from typing import Optional
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, time as dt_time
 from zoneinfo import ZoneInfo
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.connection import get_db_session
@@ -138,7 +139,6 @@ async def get_all_latest_prices(
     Returns a list of the most recent price for each provider-asset combination.
     Cached for 2 seconds to avoid redundant DB hits on page load.
     """
-    import time
     now_ts = time.time()
 
     if _latest_all_cache['data'] and now_ts < _latest_all_cache['expires']:
@@ -242,6 +242,7 @@ async def get_initial_rate():
     Get initial exchange rate (최초고시환율) for USD/KRW.
 
     Data sourced from Seoul Foreign Exchange Brokerage (smbs.biz).
+    'rates' also carries the JPY/CNY/EUR/HKD crosses from the same response.
     """
     client = get_smbs_client()
     return client.cached_data
@@ -265,7 +266,6 @@ def _most_recent_close_time_tz(now_utc: datetime, close_hour: int, close_minute:
     now_local = now_utc.replace(tzinfo=ZoneInfo('UTC')).astimezone(tz)
     today_local = now_local.date()
 
-    from datetime import time as dt_time
     close_local = datetime.combine(today_local, dt_time(close_hour, close_minute), tzinfo=tz)
 
     if now_local >= close_local and today_local.weekday() < 5:
@@ -294,7 +294,6 @@ async def get_reference_prices(
     When provider is specified, only that provider's records are used.
     Uses per-provider 60-second cache.
     """
-    import time
     now_ts = time.time()
 
     cache_key = provider or '__all__'
@@ -363,7 +362,6 @@ async def get_price_chart_data(
     session: AsyncSession = Depends(get_db_session)
 ):
     """Get downsampled price data for chart rendering. Cached for 60 seconds."""
-    import time
     now_ts = time.time()
 
     cache_key = f"{assets}_{hours}_{points}_{provider}"
@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 import asyncio
-import json
 from app.services.websocket_manager import get_ws_manager
 from app.config import get_settings
 from app.utils.logger import app_logger as logger
@@ -18,9 +17,8 @@ async def event_generator(request: Request):
     # This makes the browser's EventSource.onopen fire without delay
     yield ": connected\n\n"
 
-    # Create queue for this client
-    queue = asyncio.Queue(maxsize=settings.SSE_QUEUE_SIZE)
-    ws_manager.add_sse_client(queue)
+    # Register this client; the cursor tracks its position in the shared ring
+    cursor = ws_manager.add_sse_client()
 
     try:
         while True:
@@ -30,14 +28,19 @@ async def event_generator(request: Request):
                 break
 
             try:
-                # Wait for data with timeout (for heartbeat)
-                data = await asyncio.wait_for(
-                    queue.get(),
-                    timeout=settings.SSE_HEARTBEAT_INTERVAL
-                )
+                frames, cursor = ws_manager.get_broadcasts_since(cursor)
 
-                # Send data as SSE
-                yield f"data: {json.dumps(data)}\n\n"
+                if not frames:
+                    # Wait for data with timeout (for heartbeat)
+                    await asyncio.wait_for(
+                        ws_manager.wait_for_broadcast(cursor),
+                        timeout=settings.SSE_HEARTBEAT_INTERVAL
+                    )
+                    continue
+
+                # Frames are serialized once by the manager for all clients
+                for frame in frames:
+                    yield frame
 
             except asyncio.TimeoutError:
                 # Send heartbeat to keep connection alive
@@ -49,7 +52,7 @@ async def event_generator(request: Request):
 
     finally:
         # Remove client from broadcast list
-        ws_manager.remove_sse_client(queue)
+        ws_manager.remove_sse_client()
 
 
 @router.get("/stream")
@@ -84,5 +87,5 @@ async def get_websocket_status():
 
     return {
         "websocket_connections": status,
-        "sse_clients": len(ws_manager.broadcast_queues)
+        "sse_clients": ws_manager.sse_client_count
     }
@@ -9,6 +9,9 @@ from websockets.exceptions import WebSocketException
 from app.config import get_settings
 from app.utils.logger import app_logger as logger
 
+# Upper bound for tick epoch-ms timestamps (datetime max year is 9999)
+MAX_TIMESTAMP_MS = 253402300800000
+
 
 class BaseWebSocketClient(ABC):
     """Base class for all API WebSocket clients"""
@@ -66,6 +69,7 @@ class BaseWebSocketClient(ABC):
             'ask': 2050.50,        # optional
             'volume': 12345.67,    # optional
             'timestamp': '2024-01-23T12:34:56Z',  # optional, will default to now
+            'timestamp_ms': 1706012096000,        # optional, raw epoch ms (converted lazily)
             'metadata': {...}      # optional
         }
 
@@ -1,7 +1,6 @@
 import json
 from typing import Dict, Any, Optional
-from datetime import datetime, timezone
-from app.services.base_ws_client import BaseWebSocketClient
+from app.services.base_ws_client import BaseWebSocketClient, MAX_TIMESTAMP_MS
 from app.utils.logger import app_logger as logger
 
 
@@ -18,6 +17,9 @@ class EODHDCryptoWebSocketClient(BaseWebSocketClient):
         'eth_usd': 'ETH-USD',     # Ethereum vs USD
     }
 
+    # API symbol -> asset_type (reverse of SYMBOL_MAPPING)
+    REVERSE_SYMBOL_MAPPING = {sym: asset for asset, sym in SYMBOL_MAPPING.items()}
+
     @property
     def provider_name(self) -> str:
         return "eodhd_crypto"
@@ -34,7 +36,9 @@ class EODHDCryptoWebSocketClient(BaseWebSocketClient):
 
     def parse_message(self, raw_message: str) -> Optional[Dict[str, Any]]:
         try:
-            logger.debug(f"[{self.provider_name}] Raw message: {raw_message[:200]}")
+            logger.opt(lazy=True).debug(
+                "[{}] Raw message: {}", lambda: self.provider_name, lambda: raw_message[:200]
+            )
 
             data = json.loads(raw_message)
 
@@ -48,11 +52,7 @@ class EODHDCryptoWebSocketClient(BaseWebSocketClient):
                 return None
 
             # Map symbol back to asset_type
-            asset_type = None
-            for asset, sym in self.SYMBOL_MAPPING.items():
-                if sym == symbol:
-                    asset_type = asset
-                    break
+            asset_type = self.REVERSE_SYMBOL_MAPPING.get(symbol)
 
             if not asset_type:
                 logger.warning(f"[{self.provider_name}] Unknown symbol: {symbol}")
@@ -71,11 +71,16 @@ class EODHDCryptoWebSocketClient(BaseWebSocketClient):
                     logger.debug(f"[{self.provider_name}] No price data in message: {data}")
                     return None
 
-            # Parse timestamp
-            timestamp = None
+            # Keep the raw epoch ms; converted to datetime only when flushed,
+            # so reject values the conversion would fail on here
+            ts_ms = None
             if 't' in data or 'timestamp' in data:
                 ts_ms = data.get('t') or data.get('timestamp')
-                timestamp = datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc) if ts_ms else None
+                if ts_ms is not None and not (
+                    type(ts_ms) in (int, float) and 0 <= ts_ms < MAX_TIMESTAMP_MS
+                ):
+                    logger.warning(f"[{self.provider_name}] Invalid timestamp: {ts_ms!r}")
+                    return None
 
             return {
                 'provider': 'eodhd',
@@ -84,7 +89,8 @@ class EODHDCryptoWebSocketClient(BaseWebSocketClient):
                 'bid': float(data.get('b') or data.get('bid')) if ('b' in data or 'bid' in data) else None,
                 'ask': float(data.get('a') or data.get('ask')) if ('a' in data or 'ask' in data) else None,
                 'volume': float(data.get('v') or data.get('volume')) if ('v' in data or 'volume' in data) else None,
-                'timestamp': timestamp,
+                'timestamp': None,
+                'timestamp_ms': ts_ms,
                 'metadata': {
                     'symbol': symbol
                 }
@@ -109,7 +109,7 @@ class EODHDMSSQLWriter:
         if not relevant:
             return
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self._execute_updates, relevant)
 
     def close(self):
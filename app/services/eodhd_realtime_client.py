@@ -13,6 +13,7 @@ import asyncio
 import aiohttp
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime, timezone
+from app.services.http_session import get_http_session
 from app.utils.logger import app_logger as logger
 
 
@@ -33,12 +34,13 @@ class EODHDRealtimeClient:
     }
 
     def __init__(self, api_key: str, callback: Optional[Callable] = None,
-                 poll_interval: float = 300.0):
+                 poll_interval: float = 300.0,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.provider_name = "eodhd_realtime"
         self.api_key = api_key
         self.callback = callback
         self.running = False
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
         self.poll_interval = poll_interval  # 5 minutes default
         self.base_url = "https://eodhd.com/api/real-time"
 
@@ -50,22 +52,20 @@ class EODHDRealtimeClient:
         logger.info(f"[{self.provider_name}] Starting EODHD Real-Time client "
                      f"(interval: {self.poll_interval}s, symbols: {len(self.SYMBOL_MAPPING)})")
         self.running = True
-        self.session = aiohttp.ClientSession()
 
-        try:
-            # Fetch immediately on start
-            await self._fetch_quotes()
+        if self.session is None:
+            self.session = get_http_session()
 
-            while self.running:
-                await asyncio.sleep(self.poll_interval)
-                if self.running:
-                    try:
-                        await self._fetch_quotes()
-                    except Exception as e:
-                        logger.error(f"[{self.provider_name}] Fetch error: {e}")
-        finally:
-            if self.session:
-                await self.session.close()
+        # Fetch immediately on start
+        await self._fetch_quotes()
+
+        while self.running:
+            await asyncio.sleep(self.poll_interval)
+            if self.running:
+                try:
+                    await self._fetch_quotes()
+                except Exception as e:
+                    logger.error(f"[{self.provider_name}] Fetch error: {e}")
 
     async def stop(self):
         """Stop the polling client"""
@@ -203,6 +203,7 @@ class EODHDRealtimeClient:
 # For standalone testing
 if __name__ == "__main__":
     from app.config import get_settings
+    from app.services.http_session import close_http_session
 
     async def test_callback(data):
         print(f"  {data['asset_type']:15s} = {data['price']:.4f}  ({data['metadata'].get('symbol')})")
@@ -219,5 +220,7 @@ if __name__ == "__main__":
             await asyncio.wait_for(client.start(), timeout=15)
         except asyncio.TimeoutError:
             await client.stop()
+        finally:
+            await close_http_session()
 
     asyncio.run(main())
@@ -0,0 +1,49 @@
+"""
+Shared HTTP Session
+
+One aiohttp ClientSession for the HTTP polling clients (NauGold, SMBS,
+Twelve Data, EODHD Real-Time), so connections (TCP + TLS) and DNS lookups
+are reused across polls instead of being re-established every request,
+and the whole process shares a single connection pool.
+
+Clients get the session from get_http_session() on start (or have it passed
+in) and never close it themselves; close_http_session() closes it once on
+app shutdown.
+"""
+
+import aiohttp
+from typing import Optional
+
+from app.utils.logger import app_logger as logger
+
+
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get the shared ClientSession (created on first use inside the event loop)"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+            force_close=False,
+        )
+        _http_session = aiohttp.ClientSession(
+            connector=connector,
+            headers={'Connection': 'keep-alive'},
+        )
+        logger.info("Shared HTTP session created")
+    return _http_session
+
+
+async def close_http_session():
+    """Close the shared ClientSession (call once on shutdown)"""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+        logger.info("Shared HTTP session closed")
+    _http_session = None
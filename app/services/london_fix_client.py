@@ -30,6 +30,9 @@ CACHE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file
 
 KST = timezone(timedelta(hours=9))
 
+_ONE_DAY = timedelta(days=1)
+_FIVE_DAYS = timedelta(days=5)
+
 # UK Bank Holidays - update annually
 UK_HOLIDAYS: Set[date] = {
     # 2025
@@ -129,7 +132,7 @@ class LondonFixClient:
         16:30 UTC → same UTC date (PM fix done)
         00:30 UTC → previous UTC date (data from yesterday)
         """
-        return utc_date if hour >= 8 else utc_date - timedelta(days=1)
+        return utc_date if hour >= 8 else utc_date - _ONE_DAY
 
     def _next_slot_wait(self) -> Tuple[float, str, str]:
         """Find seconds until next fetch slot, its description, and London date.
@@ -253,7 +256,7 @@ class LondonFixClient:
 
     def _cleanup_old_dates(self):
         """Remove London dates older than 5 days to prevent memory growth."""
-        cutoff = (datetime.now(timezone.utc).date() - timedelta(days=5)).isoformat()
+        cutoff = (datetime.now(timezone.utc).date() - _FIVE_DAYS).isoformat()
         old = {d for d in self._fetched_london_dates if d < cutoff}
         if old:
             self._fetched_london_dates -= old
@@ -318,7 +321,7 @@ class LondonFixClient:
                 london_date = self._london_date_for_slot(utc_now.date(), utc_now.hour)
                 # Walk back to last business day if weekend/holiday
                 while not self._is_business_day(london_date):
-                    london_date -= timedelta(days=1)
+                    london_date -= _ONE_DAY
                 self._cache['date'] = london_date.isoformat()
             logger.info(
                 f"[LondonFix] Gold AM={self._cache['gold_am']} PM={self._cache['gold_pm']}, "
@@ -6,13 +6,23 @@ populated by a separate data collection service.
 """
 
 import asyncio
-from typing import Dict, Any, Optional, Callable
+import random
+from typing import Dict, Optional, Callable, List, Tuple
 from datetime import datetime
 import pyodbc
 
 from app.config import get_settings
+from app.services.price_tick import PriceTick
 from app.utils.logger import app_logger as logger
 
+# Reuse ODBC connections across reconnects
+pyodbc.pooling = True
+
+
+def _to_float(value) -> Optional[float]:
+    """Convert a DB numeric to float, keeping NULL as None (0 stays 0.0)"""
+    return None if value is None else float(value)
+
 
 class MassiveMSSQLClient:
     """
@@ -20,6 +30,10 @@ class MassiveMSSQLClient:
 
     The data is collected by massive_mssql_rest.py and stored in td_price_api table.
     This client polls the database periodically to get the latest prices.
+
+    Changed rows are emitted as PriceTick records. If on_batch is given, all
+    changed rows of a poll are delivered in a single call as a list instead
+    of one on_message call per row.
     """
 
     # Symbol mapping: MSSQL symbol -> (asset_type, display_symbol)
@@ -35,13 +49,22 @@ class MassiveMSSQLClient:
         'HKDKRW': ('hkd_krw', 'HKD/KRW'),
     }
 
-    def __init__(self, on_message: Callable):
+    # Reconnect backoff after database errors (seconds)
+    RECONNECT_BASE_DELAY = 1.0
+    RECONNECT_MAX_DELAY = 30.0
+
+    def __init__(self, on_message: Callable, on_batch: Optional[Callable] = None):
         self.on_message = on_message
+        self.on_batch = on_batch
         self.settings = get_settings()
         self.running = False
         self.connection = None
         self.poll_interval = self.settings.PRICE_UPDATE_INTERVAL
-        self.last_prices: Dict[str, Dict] = {}
+        # symbol -> (price, bid, ask) of the last emitted row
+        self.last_prices: Dict[str, Tuple] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reconnect_attempts = 0
 
     @property
     def provider_name(self) -> str:
@@ -78,6 +101,7 @@ class MassiveMSSQLClient:
         try:
             if not self.connection:
                 if not self._connect():
+                    self._reconnect_attempts += 1
                     return []
 
             cursor = self.connection.cursor()
@@ -96,18 +120,30 @@ class MassiveMSSQLClient:
             rows = cursor.fetchall()
             cursor.close()
 
+            self._reconnect_attempts = 0
             return rows
         except pyodbc.Error as e:
             logger.error(f"[{self.provider_name}] Database error: {e}")
-            # Try to reconnect on next poll
+            # Try to reconnect on next poll (after backoff)
             self.connection = None
+            self._reconnect_attempts += 1
             return []
         except Exception as e:
             logger.error(f"[{self.provider_name}] Error fetching prices: {e}")
             return []
 
-    def _process_row(self, row) -> Optional[Dict[str, Any]]:
-        """Process a database row into price data format"""
+    def _reconnect_delay(self) -> float:
+        """Exponential backoff with jitter for the next reconnect attempt"""
+        # Cap the exponent: 2 ** 5 already exceeds the max delay, and an
+        # unbounded attempt count would overflow float conversion
+        delay = min(
+            self.RECONNECT_MAX_DELAY,
+            self.RECONNECT_BASE_DELAY * 2 ** min(self._reconnect_attempts, 5)
+        )
+        return delay * (1 + random.uniform(-0.5, 0.5))
+
+    def _process_row(self, row, timestamp: datetime) -> Optional[PriceTick]:
+        """Process a database row into a PriceTick"""
         try:
             symbol = row[0]  # string column
             price = row[1]
@@ -119,51 +155,91 @@ class MassiveMSSQLClient:
 
             asset_type, display_symbol = self.SYMBOL_MAPPING[symbol]
 
-            # Check if price actually changed
-            last = self.last_prices.get(symbol)
-            if last and last.get('price') == price and last.get('bid') == bid and last.get('ask') == ask:
+            # Check if price actually changed (raw DB values, converted only on emit)
+            key = (price, bid, ask)
+            if self.last_prices.get(symbol) == key:
                 return None
 
             # Store current price
-            self.last_prices[symbol] = {'price': price, 'bid': bid, 'ask': ask}
-
-            return {
-                'provider': self.provider_name,
-                'asset_type': asset_type,
-                'price': float(price) if price else None,
-                'bid': float(bid) if bid else None,
-                'ask': float(ask) if ask else None,
-                'volume': None,
-                'timestamp': datetime.now(),
-                'metadata': {
-                    'symbol': display_symbol,
-                    'source': 'mssql'
-                }
-            }
+            self.last_prices[symbol] = key
+
+            return PriceTick(
+                provider=self.provider_name,
+                asset_type=asset_type,
+                price=_to_float(price),
+                bid=_to_float(bid),
+                ask=_to_float(ask),
+                volume=None,
+                timestamp=timestamp,
+                symbol=display_symbol,
+                source='mssql'
+            )
         except Exception as e:
             logger.error(f"[{self.provider_name}] Error processing row: {e}")
             return None
 
     async def _poll_loop(self):
-        """Main polling loop"""
+        """Producer: fetch rows from the database and queue them for dispatch"""
         logger.info(f"[{self.provider_name}] Starting MSSQL polling (interval: {self.poll_interval}s)")
 
-        while self.running:
-            try:
-                # Fetch prices from database (run in executor to avoid blocking)
-                loop = asyncio.get_event_loop()
-                rows = await loop.run_in_executor(None, self._fetch_prices)
+        try:
+            while self.running:
+                try:
+                    # Fetch prices from database (run in executor to avoid blocking)
+                    rows = await self._loop.run_in_executor(None, self._fetch_prices)
+
+                    if rows:
+                        self._put_latest(rows)
+
+                except Exception as e:
+                    logger.error(f"[{self.provider_name}] Poll error: {e}")
+
+                # Wait for next poll (back off while the database is unreachable)
+                if self._reconnect_attempts:
+                    delay = self._reconnect_delay()
+                    logger.warning(
+                        f"[{self.provider_name}] Reconnecting in {delay:.1f}s "
+                        f"(attempt {self._reconnect_attempts})"
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            # Wake up the dispatcher so it can exit
+            self._put_latest(None)
+
+    def _put_latest(self, item):
+        """Queue item for dispatch, replacing a snapshot the dispatcher hasn't taken yet"""
+        # Only the newest rows matter: a slow callback skips stale polls
+        # instead of replaying a backlog of old prices
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(item)
+
+    async def _dispatch_loop(self):
+        """Consumer: process queued rows and invoke the callbacks"""
+        while True:
+            rows = await self._queue.get()
+            if rows is None:
+                break
 
-                for row in rows:
-                    data = self._process_row(row)
-                    if data:
-                        await self.on_message(data)
+            try:
+                # One timestamp for the whole poll
+                timestamp = datetime.now()
+                batch: List[PriceTick] = [
+                    data for row in rows
+                    if (data := self._process_row(row, timestamp))
+                ]
+
+                if batch:
+                    if self.on_batch:
+                        await self.on_batch(batch)
+                    else:
+                        for data in batch:
+                            await self.on_message(data)
 
             except Exception as e:
-                logger.error(f"[{self.provider_name}] Poll error: {e}")
-
-            # Wait for next poll
-            await asyncio.sleep(self.poll_interval)
+                logger.error(f"[{self.provider_name}] Dispatch error: {e}")
 
     async def start(self):
         """Start the MSSQL polling client"""
@@ -174,14 +250,16 @@ class MassiveMSSQLClient:
         logger.info(f"[{self.provider_name}] Starting MSSQL client")
 
         # Initial connection
-        loop = asyncio.get_event_loop()
-        connected = await loop.run_in_executor(None, self._connect)
+        self._loop = asyncio.get_running_loop()
+        connected = await self._loop.run_in_executor(None, self._connect)
 
         if not connected:
             logger.warning(f"[{self.provider_name}] Initial connection failed, will retry in poll loop")
 
-        # Start polling loop
-        await self._poll_loop()
+        # Run DB polling and callback dispatch concurrently so slow
+        # callbacks don't delay the next poll
+        self._queue = asyncio.Queue(maxsize=1)
+        await asyncio.gather(self._poll_loop(), self._dispatch_loop())
 
     async def stop(self):
         """Stop the MSSQL polling client"""
@@ -6,11 +6,11 @@ Replaces the previous Massive MSSQL polling approach.
 """
 
 import asyncio
-import re
 import aiohttp
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime
 
+from app.services.http_session import get_http_session
 from app.utils.logger import app_logger as logger
 
 
@@ -20,6 +20,9 @@ class NaugoldClient:
 
     Replaces MassiveMSSQLClient. Keeps provider name 'massive' for
     backward compatibility with database records and frontend config.
+
+    The page itself is fetched by the process-wide _SharedNaugoldPoller;
+    each client subscribes its on_message callback to it.
     """
 
     # HTML span ID prefix -> (asset_type, display_symbol)
@@ -40,39 +43,165 @@ class NaugoldClient:
     def __init__(self, on_message: Callable):
         self.on_message = on_message
         self.running = False
-        self.session: Optional[aiohttp.ClientSession] = None
         self.poll_interval = 3.0
-        self.last_prices: Dict[str, Dict] = {}
+        self._stopped: Optional[asyncio.Event] = None
 
     @property
     def provider_name(self) -> str:
         return "massive"
 
-    def _parse_price(self, text: str) -> Optional[float]:
-        """Parse a price string like '4,902.18' into a float"""
+    async def start(self):
+        """Start the client (subscribes to the process-wide NauGold poller)"""
+        if self.running:
+            return
+
+        self.running = True
+        self._stopped = asyncio.Event()
+        logger.info(
+            f"[{self.provider_name}] Starting NauGold client "
+            f"(url: {self.URL}, interval: {self.poll_interval}s)"
+        )
+
+        poller = _get_shared_poller()
+        await poller.subscribe(self.on_message, self.poll_interval)
+
         try:
-            return float(text.replace(',', ''))
+            await self._stopped.wait()
+        finally:
+            await poller.unsubscribe(self.on_message)
+
+    async def stop(self):
+        """Stop the polling client"""
+        self.running = False
+        if self._stopped:
+            self._stopped.set()
+        logger.info(f"[{self.provider_name}] NauGold client stopped")
+
+
+class _SharedNaugoldPoller:
+    """
+    Single naugold.com poll loop shared by every NaugoldClient in the process.
+
+    The page is fetched and parsed once per interval and the resulting
+    updates are dispatched to all subscribed callbacks. The poll interval is
+    the shortest one requested by the current subscribers. A new subscriber
+    is sent the latest known prices right away; existing subscribers only
+    receive changes.
+    """
+
+    provider_name = "massive"
+
+    # Flattened (prefix, asset_type, display_symbol, bid_anchor, ask_anchor)
+    _FIELDS = tuple(
+        (prefix, asset_type, display_symbol,
+         f'id="{prefix}_bid"'.encode('ascii'), f'id="{prefix}_ask"'.encode('ascii'))
+        for prefix, (asset_type, display_symbol) in NaugoldClient.PRICE_FIELDS.items()
+    )
+
+    # Every span id anchor on the page
+    _ALL_ANCHORS = tuple(
+        anchor for field in _FIELDS for anchor in field[3:]
+    )
+
+    READ_CHUNK_SIZE = 8192
+
+    def __init__(self):
+        self._subscribers: List[Callable] = []
+        # Requested poll interval per subscriber (parallel to _subscribers)
+        self._intervals: List[float] = []
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.poll_interval = 3.0
+
+        # prefix -> (bid_text, ask_text) as last seen on the page
+        self._last_raw: Dict[str, Tuple[Optional[bytes], Optional[bytes]]] = {}
+        # asset_type -> last emitted row (replayed to new subscribers)
+        self._latest: Dict[str, Dict[str, Any]] = {}
+
+        # Validators from the last 200 response (for conditional requests)
+        self._last_modified: Optional[str] = None
+        self._etag: Optional[str] = None
+
+    def _reset_state(self):
+        """Forget everything seen on the page (next poll starts fresh)"""
+        self._last_raw.clear()
+        self._latest.clear()
+        self._last_modified = None
+        self._etag = None
+
+    def _parse_price(self, text: bytes) -> Optional[float]:
+        """Parse a price like b'4,902.18' into a float"""
+        try:
+            # Only strip commas when present (most quotes have none)
+            if b',' in text:
+                text = text.replace(b',', b'')
+            return float(text)
         except (ValueError, TypeError):
             return None
 
-    def _parse_html(self, html: str) -> list:
-        """Parse HTML and extract bid/ask prices from span elements"""
+    @staticmethod
+    def _span_text(html: bytes, anchor: bytes, start: int = 0) -> Optional[bytes]:
+        """Text of the first element (at or after start) whose opening tag contains anchor"""
+        i = html.find(anchor, start)
+        if i < 0:
+            return None
+        j = html.find(b'>', i) + 1
+        k = html.find(b'<', j)
+        if j == 0 or k < 0:
+            return None
+        return html[j:k]
+
+    async def _read_price_section(self, response: aiohttp.ClientResponse) -> bytes:
+        """
+        Read the body in chunks, buffering only until every price span is complete.
+
+        The rest of the page is drained without buffering so the keep-alive
+        connection can go back to the pool (closing early would force a new
+        TCP/TLS handshake on the next poll).
+        """
+        buf = bytearray()
+        # Pending anchor -> offset to resume its search from, so each chunk
+        # only rescans the new bytes (plus room for an anchor split across chunks)
+        pending = {anchor: 0 for anchor in self._ALL_ANCHORS}
+
+        async for chunk in response.content.iter_chunked(self.READ_CHUNK_SIZE):
+            if pending:
+                buf.extend(chunk)
+                for anchor, start in list(pending.items()):
+                    i = buf.find(anchor, start)
+                    if i < 0:
+                        pending[anchor] = max(0, len(buf) - len(anchor) + 1)
+                    elif self._span_text(buf, anchor, i) is not None:
+                        del pending[anchor]
+                    else:
+                        # Anchor seen but its text isn't complete yet
+                        pending[anchor] = i
+
+        return bytes(buf)
+
+    def _parse_html(self, html: bytes) -> list:
+        """Parse raw HTML bytes and extract bid/ask prices from span elements"""
         results = []
         timestamp = datetime.now()
 
-        for prefix, (asset_type, display_symbol) in self.PRICE_FIELDS.items():
-            bid_match = re.search(
-                rf'id="{prefix}_bid"[^>]*>([\d,]+\.?\d*)</span>', html
-            )
-            ask_match = re.search(
-                rf'id="{prefix}_ask"[^>]*>([\d,]+\.?\d*)</span>', html
-            )
+        for prefix, asset_type, display_symbol, bid_anchor, ask_anchor in self._FIELDS:
+            # Literal substring search is cheaper than a regex scan here
+            bid_text = self._span_text(html, bid_anchor)
+            ask_text = self._span_text(html, ask_anchor)
 
-            if not (bid_match or ask_match):
+            if not (bid_text or ask_text):
                 continue
 
-            bid = self._parse_price(bid_match.group(1)) if bid_match else None
-            ask = self._parse_price(ask_match.group(1)) if ask_match else None
+            # Skip if unchanged: compare raw text before parsing floats
+            raw = (bid_text, ask_text)
+            if self._last_raw.get(prefix) == raw:
+                continue
+            self._last_raw[prefix] = raw
+
+            bid = self._parse_price(bid_text) if bid_text else None
+            ask = self._parse_price(ask_text) if ask_text else None
 
             # Use ask as the price (fallback to bid if ask unavailable)
             if ask:
@@ -82,14 +211,6 @@ class NaugoldClient:
             else:
                 continue
 
-            # Skip if price unchanged
-            last = self.last_prices.get(prefix)
-            if (last and last.get('price') == price
-                    and last.get('bid') == bid and last.get('ask') == ask):
-                continue
-
-            self.last_prices[prefix] = {'price': price, 'bid': bid, 'ask': ask}
-
             results.append({
                 'provider': self.provider_name,
                 'asset_type': asset_type,
@@ -107,23 +228,44 @@ class NaugoldClient:
         return results
 
     async def _fetch_and_parse(self):
-        """Fetch HTML and parse prices"""
+        """Fetch HTML, parse prices and dispatch the changed ones"""
         try:
+            # Conditional request: the server answers 304 if the page is unchanged
+            headers = {}
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+
             async with self.session.get(
-                self.URL,
+                NaugoldClient.URL,
+                headers=headers,
                 timeout=aiohttp.ClientTimeout(total=10)
             ) as response:
+                if response.status == 304:
+                    return
+
                 if response.status != 200:
                     logger.warning(
                         f"[{self.provider_name}] HTTP {response.status} from naugold.com"
                     )
                     return
 
-                html = await response.text()
+                last_modified = response.headers.get('Last-Modified')
+                etag = response.headers.get('ETag')
+
+                # Only the short numeric fields are needed, so skip decoding the page
+                html = await self._read_price_section(response)
                 prices = self._parse_html(html)
 
+                # Store validators only once this page version has been parsed,
+                # so a failed body read isn't answered with 304 next poll
+                self._last_modified = last_modified
+                self._etag = etag
+
                 for data in prices:
-                    await self.on_message(data)
+                    self._latest[data['asset_type']] = data
+                    await self._dispatch(data)
 
                 if prices:
                     logger.debug(
@@ -137,36 +279,74 @@ class NaugoldClient:
         except Exception as e:
             logger.error(f"[{self.provider_name}] Error: {e}")
 
-    async def start(self):
-        """Start the polling client"""
-        if self.running:
-            return
-
-        self.running = True
-        logger.info(
-            f"[{self.provider_name}] Starting NauGold client "
-            f"(url: {self.URL}, interval: {self.poll_interval}s)"
-        )
-
-        self.session = aiohttp.ClientSession()
+    async def _poll_loop(self):
+        """Poll naugold.com until cancelled"""
+        self.session = get_http_session()
 
         try:
-            while self.running:
+            while True:
                 await self._fetch_and_parse()
                 await asyncio.sleep(self.poll_interval)
         finally:
-            if self.session:
-                await self.session.close()
-                self.session = None
+            self.session = None
 
-    async def stop(self):
-        """Stop the polling client"""
-        self.running = False
-        logger.info(f"[{self.provider_name}] NauGold client stopped")
+    async def _dispatch(self, data: Dict[str, Any]):
+        for callback in list(self._subscribers):
+            await self._deliver(callback, data)
+
+    async def _deliver(self, callback: Callable, data: Dict[str, Any]):
+        try:
+            await callback(data)
+        except Exception as e:
+            logger.error(f"[{self.provider_name}] Subscriber error: {e}")
+
+    async def subscribe(self, callback: Callable, poll_interval: float):
+        async with self._lock:
+            self._subscribers.append(callback)
+            self._intervals.append(poll_interval)
+            self.poll_interval = min(self._intervals)
+
+            # Send the new subscriber the current prices now, rather than
+            # re-emitting them to everyone on the next poll
+            for data in list(self._latest.values()):
+                await self._deliver(callback, data)
+
+            if self._task is None:
+                self._task = asyncio.create_task(self._poll_loop())
+
+    async def unsubscribe(self, callback: Callable):
+        async with self._lock:
+            if callback in self._subscribers:
+                i = self._subscribers.index(callback)
+                del self._subscribers[i]
+                del self._intervals[i]
+                if self._intervals:
+                    self.poll_interval = min(self._intervals)
+
+            if not self._subscribers and self._task:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+                self._task = None
+                self._reset_state()
+
+
+_shared_poller: Optional[_SharedNaugoldPoller] = None
+
+
+def _get_shared_poller() -> _SharedNaugoldPoller:
+    global _shared_poller
+    if _shared_poller is None:
+        _shared_poller = _SharedNaugoldPoller()
+    return _shared_poller
 
 
 # For standalone testing
 if __name__ == "__main__":
+    from app.services.http_session import close_http_session
+
     async def test_callback(data):
         print(
             f"Received: {data['asset_type']} = {data['price']:.4f} "
@@ -179,5 +359,7 @@ if __name__ == "__main__":
             await asyncio.wait_for(client.start(), timeout=10)
         except asyncio.TimeoutError:
             await client.stop()
+        finally:
+            await close_http_session()
 
     asyncio.run(main())
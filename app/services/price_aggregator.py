@@ -8,20 +8,54 @@ and provide smoother price updates.
 import asyncio
 from typing import Dict, Any, List, Callable, Optional
 from datetime import datetime
-from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from app.config import get_settings
 from app.utils.logger import app_logger as logger
 
 
+@dataclass
+class AggregatedPrice:
+    """Averaged price emitted once per interval"""
+    __slots__ = (
+        'provider', 'asset_type', 'price', 'bid', 'ask',
+        'volume', 'timestamp', 'metadata',
+    )
+
+    provider: str
+    asset_type: str
+    price: Optional[float]
+    bid: Optional[float]
+    ask: Optional[float]
+    volume: Optional[float]
+    timestamp: datetime
+    metadata: Optional[Dict]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict format used for JSON serialization"""
+        return {
+            'provider': self.provider,
+            'asset_type': self.asset_type,
+            'price': self.price,
+            'bid': self.bid,
+            'ask': self.ask,
+            'volume': self.volume,
+            'timestamp': self.timestamp,
+            'metadata': self.metadata,
+        }
+
+
 @dataclass
 class PriceBuffer:
-    """Buffer for collecting prices within an interval"""
-    prices: List[float] = field(default_factory=list)
-    bids: List[float] = field(default_factory=list)
-    asks: List[float] = field(default_factory=list)
-    volumes: List[float] = field(default_factory=list)
+    """Buffer for collecting prices within an interval (running sums)"""
+    price_sum: float = 0.0
+    price_n: int = 0
+    bid_sum: float = 0.0
+    bid_n: int = 0
+    ask_sum: float = 0.0
+    ask_n: int = 0
+    vol_sum: float = 0.0
+    vol_n: int = 0
     last_metadata: Optional[Dict] = None
     last_timestamp: Optional[datetime] = None
 
@@ -29,51 +63,74 @@ class PriceBuffer:
             volume: float = None, metadata: Dict = None, timestamp: datetime = None):
         """Add a price point to the buffer"""
         if price is not None:
-            self.prices.append(price)
+            self.price_sum += price
+            self.price_n += 1
         if bid is not None:
-            self.bids.append(bid)
+            self.bid_sum += bid
+            self.bid_n += 1
         if ask is not None:
-            self.asks.append(ask)
+            self.ask_sum += ask
+            self.ask_n += 1
         if volume is not None:
-            self.volumes.append(volume)
+            self.vol_sum += volume
+            self.vol_n += 1
         if metadata:
             self.last_metadata = metadata
         if timestamp:
             self.last_timestamp = timestamp
 
-    def get_average(self) -> Dict[str, Any]:
-        """Calculate averages from buffered data"""
-        result = {}
-
-        if self.prices:
-            result['price'] = sum(self.prices) / len(self.prices)
-        if self.bids:
-            result['bid'] = sum(self.bids) / len(self.bids)
-        if self.asks:
-            result['ask'] = sum(self.asks) / len(self.asks)
-        if self.volumes:
-            result['volume'] = sum(self.volumes) / len(self.volumes)
-        if self.last_metadata:
-            result['metadata'] = self.last_metadata
-        if self.last_timestamp:
-            result['timestamp'] = self.last_timestamp
-        else:
-            result['timestamp'] = datetime.now()
-
-        return result
+    def get_average(self, provider: str, asset_type: str,
+                    default_ts: Optional[datetime] = None) -> AggregatedPrice:
+        """
+        Calculate averages from buffered data.
+
+        Args:
+            provider: Provider of the buffered prices
+            asset_type: Asset type of the buffered prices
+            default_ts: Timestamp to use when no sample carried one
+        """
+        timestamp = self.last_timestamp or default_ts or datetime.now()
+
+        # Single sample (common for idle symbols): the sums are the values
+        if self.price_n == 1 and self.bid_n <= 1 and self.ask_n <= 1 and self.vol_n <= 1:
+            return AggregatedPrice(
+                provider,
+                asset_type,
+                self.price_sum,
+                self.bid_sum if self.bid_n else None,
+                self.ask_sum if self.ask_n else None,
+                self.vol_sum if self.vol_n else None,
+                timestamp,
+                self.last_metadata,
+            )
+
+        return AggregatedPrice(
+            provider,
+            asset_type,
+            self.price_sum / self.price_n if self.price_n else None,
+            self.bid_sum / self.bid_n if self.bid_n else None,
+            self.ask_sum / self.ask_n if self.ask_n else None,
+            self.vol_sum / self.vol_n if self.vol_n else None,
+            timestamp,
+            self.last_metadata,
+        )
 
     def clear(self):
         """Clear the buffer"""
-        self.prices.clear()
-        self.bids.clear()
-        self.asks.clear()
-        self.volumes.clear()
+        self.price_sum = 0.0
+        self.price_n = 0
+        self.bid_sum = 0.0
+        self.bid_n = 0
+        self.ask_sum = 0.0
+        self.ask_n = 0
+        self.vol_sum = 0.0
+        self.vol_n = 0
         self.last_metadata = None
         self.last_timestamp = None
 
     def has_data(self) -> bool:
         """Check if buffer has any data"""
-        return len(self.prices) > 0
+        return self.price_n > 0
 
 
 class PriceAggregator:
@@ -89,22 +146,40 @@ class PriceAggregator:
         Initialize the aggregator.
 
         Args:
-            on_aggregated: Callback function to receive aggregated data
+            on_aggregated: Callback function to receive AggregatedPrice records
             interval: Aggregation interval in seconds (default: from settings)
         """
         self.settings = get_settings()
         self.interval = interval or self.settings.PRICE_UPDATE_INTERVAL
         self.on_aggregated = on_aggregated
 
-        # Buffers: {(provider, asset_type): PriceBuffer}
-        self.buffers: Dict[tuple, PriceBuffer] = defaultdict(PriceBuffer)
+        # Buffers stored by integer id; _idx maps (provider, asset_type) -> id
+        self._buffers: List[PriceBuffer] = []
+        self._keys: List[tuple] = []
+        self._idx: Dict[tuple, int] = {}
 
         # Track last emitted values to avoid duplicates
-        self.last_emitted: Dict[tuple, Dict] = {}
+        self.last_emitted: Dict[tuple, AggregatedPrice] = {}
 
         self.running = False
         self._task = None
 
+    def register(self, provider: str, asset_type: str) -> int:
+        """
+        Pre-register a (provider, asset_type) buffer.
+
+        Returns:
+            Integer id of the buffer
+        """
+        key = (provider, asset_type)
+        idx = self._idx.get(key)
+        if idx is None:
+            idx = len(self._buffers)
+            self._buffers.append(PriceBuffer())
+            self._keys.append(key)
+            self._idx[key] = idx
+        return idx
+
     async def add_price(self, data: Dict[str, Any]):
         """
         Add a price data point to the buffer.
@@ -120,8 +195,10 @@ class PriceAggregator:
             if not all([provider, asset_type, price]):
                 return
 
-            key = (provider, asset_type)
-            buffer = self.buffers[key]
+            idx = self._idx.get((provider, asset_type))
+            if idx is None:
+                idx = self.register(provider, asset_type)
+            buffer = self._buffers[idx]
 
             buffer.add(
                 price=price,
@@ -137,39 +214,36 @@ class PriceAggregator:
 
     async def _emit_aggregates(self):
         """Calculate and emit aggregated data for all buffers"""
-        for key, buffer in list(self.buffers.items()):
+        # One fallback timestamp for the whole aggregation tick
+        now = datetime.now()
+
+        for idx, buffer in enumerate(self._buffers):
             if not buffer.has_data():
                 continue
 
+            key = self._keys[idx]
             try:
                 provider, asset_type = key
-                avg_data = buffer.get_average()
+                aggregated = buffer.get_average(provider, asset_type, default_ts=now)
 
                 # Check if data actually changed significantly
                 last = self.last_emitted.get(key)
-                if last:
-                    price_change = abs(avg_data.get('price', 0) - last.get('price', 0))
+                if last and last.price:
+                    price_change = abs(aggregated.price - last.price)
                     # Skip if price change is negligible (less than 0.0001%)
-                    if last.get('price') and price_change / last['price'] < 0.000001:
+                    if price_change / last.price < 0.000001:
                         buffer.clear()
                         continue
 
-                # Build aggregated data
-                aggregated = {
-                    'provider': provider,
-                    'asset_type': asset_type,
-                    **avg_data
-                }
-
                 # Store for comparison
-                self.last_emitted[key] = avg_data
+                self.last_emitted[key] = aggregated
 
                 # Emit the aggregated data
                 await self.on_aggregated(aggregated)
 
                 logger.debug(
-                    f"[Aggregator] Emitted: {provider}/{asset_type} = {avg_data.get('price', 0):.4f} "
-                    f"(samples: {len(buffer.prices)})"
+                    f"[Aggregator] Emitted: {provider}/{asset_type} = {aggregated.price:.4f} "
+                    f"(samples: {buffer.price_n})"
                 )
 
             except Exception as e:
@@ -215,7 +289,9 @@ class PriceAggregator:
         # Emit any remaining data
         await self._emit_aggregates()
 
-        self.buffers.clear()
+        self._buffers.clear()
+        self._keys.clear()
+        self._idx.clear()
         self.last_emitted.clear()
 
         logger.info("[Aggregator] Stopped")
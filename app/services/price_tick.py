@@ -0,0 +1,75 @@
+"""
+Price Tick
+
+Fixed-layout records for price updates emitted by polling clients and
+broadcast to SSE clients. Uses __slots__ so each tick avoids the
+per-instance dict (and the nested metadata dict) of the legacy dict format.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+from datetime import datetime
+
+
+@dataclass
+class PriceTick:
+    """Single price update from a provider"""
+    __slots__ = (
+        'provider', 'asset_type', 'price', 'bid', 'ask',
+        'volume', 'timestamp', 'symbol', 'source',
+    )
+
+    provider: str
+    asset_type: str
+    price: Optional[float]
+    bid: Optional[float]
+    ask: Optional[float]
+    volume: Optional[float]
+    timestamp: Optional[datetime]
+    symbol: str
+    source: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dict format used by the message handlers"""
+        return {
+            'provider': self.provider,
+            'asset_type': self.asset_type,
+            'price': self.price,
+            'bid': self.bid,
+            'ask': self.ask,
+            'volume': self.volume,
+            'timestamp': self.timestamp,
+            'metadata': {
+                'symbol': self.symbol,
+                'source': self.source
+            }
+        }
+
+
+@dataclass
+class BroadcastTick:
+    """Price update as sent to SSE clients (serialized directly by orjson)"""
+    __slots__ = (
+        'provider', 'asset_type', 'price', 'bid', 'ask',
+        'volume', 'timestamp',
+    )
+
+    provider: str
+    asset_type: str
+    price: float
+    bid: Optional[float]
+    ask: Optional[float]
+    volume: Optional[float]
+    timestamp: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict (for payloads that carry extra fields)"""
+        return {
+            'provider': self.provider,
+            'asset_type': self.asset_type,
+            'price': self.price,
+            'bid': self.bid,
+            'ask': self.ask,
+            'volume': self.volume,
+            'timestamp': self.timestamp,
+        }
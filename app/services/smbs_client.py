@@ -11,13 +11,24 @@ import asyncio
 import random
 import re
 import aiohttp
+from collections import namedtuple
+from functools import lru_cache
 from typing import Dict, Optional
 from datetime import datetime, timezone, timedelta, date
+from app.services.http_session import get_http_session
 from app.utils.logger import app_logger as logger
 
 
 KST = timezone(timedelta(hours=9))
 
+# KRW cross rates in the query-string-style response: ...&USD=1,427.00&JPY=...
+# (not preceded by a letter, so e.g. 'XUSD=' doesn't match; number shape as
+# in the original per-currency pattern, so a trailing '.' is not captured)
+_RATES_RE = re.compile(rb'(?<![A-Za-z])(USD|JPY|CNY|EUR|HKD)=(\d[\d,]*(?:\.\d+)?)')
+
+# Immutable snapshot of the latest fetched rates (rate = USD/KRW)
+RateCache = namedtuple('RateCache', 'rate date last_updated rates')
+
 # Korean public holidays - update annually
 KR_HOLIDAYS = {
     # 2025
@@ -38,6 +49,9 @@ KR_HOLIDAYS = {
     date(2027, 12, 25),
 }
 
+# Holidays as day ordinals (int hashing is cheaper than date hashing)
+_KR_HOLIDAY_ORDS = frozenset(d.toordinal() for d in KR_HOLIDAYS)
+
 
 class SMBSClient:
     """
@@ -46,6 +60,7 @@ class SMBSClient:
     Endpoint: http://smbs.biz/Flash/TodayExRate_flash.jsp?tr_date=YYYY-MM-DD
     Returns plain text with key=value pairs separated by &
     Example: ...&USD=1,427.00&...
+    The other KRW crosses in the response (JPY, CNY, EUR, HKD) are cached too.
 
     Schedule:
     - Checks at startup
@@ -69,19 +84,17 @@ class SMBSClient:
     def __init__(self):
         self.running = False
         self.session: Optional[aiohttp.ClientSession] = None
-        self._cache: Dict = {
-            'rate': None,
-            'date': None,
-            'last_updated': None
-        }
+        self._cache = RateCache(rate=None, date=None, last_updated=None, rates={})
         self._today_fetched: Optional[str] = None
+        self._ua_idx = 0
 
     @staticmethod
     def _is_business_day(d: date) -> bool:
         """Check if a date is a Korean business day (not weekend, not holiday)."""
-        return d.weekday() < 5 and d not in KR_HOLIDAYS
+        return d.weekday() < 5 and d.toordinal() not in _KR_HOLIDAY_ORDS
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def _last_business_day(from_date: date) -> date:
         """Find the most recent business day on or before from_date."""
         d = from_date
@@ -93,12 +106,12 @@ class SMBSClient:
 
     @property
     def cached_data(self) -> Dict:
-        return dict(self._cache)
+        return self._cache._asdict()
 
     async def start(self):
         """Start the daily fetch loop"""
         self.running = True
-        self.session = aiohttp.ClientSession()
+        self.session = get_http_session()
         logger.info("[SMBS] Starting SMBS exchange rate client")
 
         try:
@@ -107,7 +120,7 @@ class SMBSClient:
                 if await self._fetch_rate():
                     today_str = datetime.now(KST).strftime('%Y-%m-%d')
                     self._today_fetched = today_str
-                    logger.info(f"[SMBS] Initial rate: {self._cache['rate']} KRW (date: {self._cache['date']})")
+                    logger.info(f"[SMBS] Initial rate: {self._cache.rate} KRW (date: {self._cache.date})")
             except Exception as e:
                 logger.error(f"[SMBS] Initial fetch error: {e}")
 
@@ -129,7 +142,7 @@ class SMBSClient:
                     try:
                         if await self._fetch_rate():
                             self._today_fetched = today_str
-                            logger.info(f"[SMBS] Non-business day rate: {self._cache['rate']} KRW (from {self._cache['date']})")
+                            logger.info(f"[SMBS] Non-business day rate: {self._cache.rate} KRW (from {self._cache.date})")
                             continue
                     except Exception as e:
                         logger.error(f"[SMBS] Weekend fetch error: {e}")
@@ -146,19 +159,18 @@ class SMBSClient:
                 # Within poll window or after - try fetching
                 try:
                     success = await self._fetch_rate()
-                    if success and self._cache.get('rate'):
+                    if success and self._cache.rate:
                         self._today_fetched = today_str
-                        logger.info(f"[SMBS] Today's rate confirmed: {self._cache['rate']} KRW")
+                        logger.info(f"[SMBS] Today's rate confirmed: {self._cache.rate} KRW")
                         continue
                 except Exception as e:
                     logger.error(f"[SMBS] Fetch error: {e}")
 
-                jitter = random.uniform(-60, 60)
+                jitter = (random.random() - 0.5) * 120  # +/- 60s
                 await asyncio.sleep(self.POLL_INTERVAL + jitter)
 
         finally:
-            if self.session:
-                await self.session.close()
+            self.session = None
 
     async def _sleep_until(self, seconds: float):
         remaining = seconds
@@ -171,6 +183,12 @@ class SMBSClient:
         self.running = False
         logger.info("[SMBS] Stopped")
 
+    def _next_user_agent(self) -> str:
+        """Rotate through USER_AGENTS"""
+        ua = self.USER_AGENTS[self._ua_idx % len(self.USER_AGENTS)]
+        self._ua_idx += 1
+        return ua
+
     async def _fetch_rate(self) -> bool:
         """Fetch USD/KRW rate from SMBS for the latest business day."""
         now_kst = datetime.now(KST)
@@ -178,7 +196,7 @@ class SMBSClient:
         target_str = target_date.isoformat()
 
         headers = {
-            'User-Agent': random.choice(self.USER_AGENTS),
+            'User-Agent': self._next_user_agent(),
             'Accept': 'text/html, */*',
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8',
             'Referer': 'http://smbs.biz/ExRate/TodayExRate.jsp',
@@ -196,25 +214,34 @@ class SMBSClient:
                     logger.warning(f"[SMBS] HTTP {resp.status}")
                     return False
 
-                # Response is plain text in EUC-KR, but rate data is ASCII
-                text = await resp.text(encoding='euc-kr', errors='replace')
+                # Response is plain text in EUC-KR, but rate data is ASCII,
+                # so scan the raw bytes and decode only the matched value
+                raw = await resp.read()
 
-                # Parse USD rate from query-string-style response
+                # Parse all KRW cross rates in one pass (first occurrence wins)
                 # Format: ...&USD=1,427.00&...
-                usd_match = re.search(r'USD=([\d,]+\.?\d*)', text)
-                if not usd_match:
+                rates: Dict[str, float] = {}
+                for m in _RATES_RE.finditer(raw):
+                    try:
+                        rates.setdefault(m.group(1).decode('ascii'), float(m.group(2).replace(b',', b'')))
+                    except ValueError:
+                        continue
+
+                rate = rates.get('USD')
+                if rate is None:
                     logger.warning("[SMBS] USD rate not found in response")
                     return False
 
-                rate_str = usd_match.group(1).replace(',', '')
-                rate = float(rate_str)
-
                 if rate <= 0:
                     return False
 
-                self._cache['rate'] = rate
-                self._cache['date'] = target_str
-                self._cache['last_updated'] = datetime.now(KST).isoformat()
+                # Swap in a new immutable snapshot (readers never see a partial update)
+                self._cache = RateCache(
+                    rate=rate,
+                    date=target_str,
+                    last_updated=datetime.now(KST).isoformat(),
+                    rates=rates
+                )
 
                 logger.info(f"[SMBS] USD/KRW = {rate} ({target_str})")
                 return True
@@ -7,9 +7,11 @@ Fetches real-time quotes for Gold, Silver, and USD/KRW.
 
 import asyncio
 import aiohttp
+import orjson
 from typing import Dict, Any, Optional, Callable, List
 from datetime import datetime
 from loguru import logger
+from app.services.http_session import get_http_session
 
 
 class TwelveDataClient:
@@ -28,12 +30,16 @@ class TwelveDataClient:
         'usd_jpy': 'USD/JPY',
     }
 
-    def __init__(self, api_key: str, callback: Optional[Callable] = None):
+    # Reverse mapping: API symbol -> asset_type
+    REVERSE_SYMBOL_MAPPING = {v: k for k, v in SYMBOL_MAPPING.items()}
+
+    def __init__(self, api_key: str, callback: Optional[Callable] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.provider_name = "twelve_data"
         self.api_key = api_key
         self.callback = callback
         self.running = False
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
         self.fetch_interval = 30.0  # 30 second interval
         self.base_url = "https://api.twelvedata.com"
 
@@ -41,19 +47,27 @@ class TwelveDataClient:
         """Start the HTTP polling client"""
         logger.info(f"[{self.provider_name}] Starting Twelve Data HTTP client")
         self.running = True
-        self.session = aiohttp.ClientSession()
 
-        try:
-            while self.running:
-                try:
-                    await self._fetch_quotes()
-                except Exception as e:
-                    logger.error(f"[{self.provider_name}] Fetch error: {e}")
+        if self.session is None:
+            self.session = get_http_session()
 
-                await asyncio.sleep(self.fetch_interval)
-        finally:
-            if self.session:
-                await self.session.close()
+        # Deadline-based schedule: requests start every fetch_interval seconds
+        # regardless of how long each fetch takes
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        while self.running:
+            try:
+                await self._fetch_quotes()
+            except Exception as e:
+                logger.error(f"[{self.provider_name}] Fetch error: {e}")
+
+            next_tick += self.fetch_interval
+            now = loop.time()
+            if next_tick < now:
+                # Fell behind (e.g. loop stalled): skip missed slots instead of bursting
+                next_tick = now
+            await asyncio.sleep(next_tick - now)
 
     async def stop(self):
         """Stop the client"""
@@ -71,12 +85,17 @@ class TwelveDataClient:
         }
 
         try:
-            async with self.session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            async with self.session.get(
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
                 if response.status != 200:
                     logger.warning(f"[{self.provider_name}] HTTP {response.status}")
                     return
 
-                data = await response.json()
+                # Parse the raw body directly (no intermediate str decode)
+                data = orjson.loads(await response.read())
 
                 # Handle API errors
                 if "code" in data and data.get("status") == "error":
@@ -89,6 +108,8 @@ class TwelveDataClient:
             logger.warning(f"[{self.provider_name}] Request timeout")
         except aiohttp.ClientError as e:
             logger.error(f"[{self.provider_name}] Client error: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.error(f"[{self.provider_name}] Invalid JSON response: {e}")
 
     async def _process_response(self, data: Dict[str, Any]):
         """Process API response and call callback for each price"""
@@ -116,11 +137,7 @@ class TwelveDataClient:
                 return
 
             # Map symbol back to asset_type
-            asset_type = None
-            for asset, api_symbol in self.SYMBOL_MAPPING.items():
-                if api_symbol == sym:
-                    asset_type = asset
-                    break
+            asset_type = self.REVERSE_SYMBOL_MAPPING.get(sym)
 
             if not asset_type:
                 logger.debug(f"[{self.provider_name}] Unknown symbol: {sym}")
@@ -147,7 +164,11 @@ class TwelveDataClient:
             if self.callback:
                 await self.callback(price_data)
 
-            logger.debug(f"[{self.provider_name}] {sym}: {price:.4f}")
+            # Lazy: formatted only when DEBUG is enabled
+            logger.opt(lazy=True).debug(
+                "[{}] {}: {:.4f}",
+                lambda: self.provider_name, lambda: sym, lambda: price
+            )
 
         except Exception as e:
             logger.error(f"[{self.provider_name}] Error processing quote: {e}")
@@ -160,6 +181,7 @@ class TwelveDataClient:
 # For standalone testing
 if __name__ == "__main__":
     from app.config import get_settings
+    from app.services.http_session import close_http_session
 
     async def test_callback(data):
         print(f"Received: {data['asset_type']} = {data['price']:.4f}")
@@ -175,5 +197,7 @@ if __name__ == "__main__":
             await asyncio.wait_for(client.start(), timeout=10)
         except asyncio.TimeoutError:
             await client.stop()
+        finally:
+            await close_http_session()
 
     asyncio.run(main())
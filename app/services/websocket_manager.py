@@ -1,18 +1,29 @@
 import asyncio
-from typing import List, Dict, Any
+import orjson
+from collections import deque
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 from app.services.eodhd_ws_client import EODHDWebSocketClient
 from app.services.eodhd_crypto_ws_client import EODHDCryptoWebSocketClient
 from app.services.eodhd_realtime_client import EODHDRealtimeClient
 from app.services.twelve_data_client import TwelveDataClient
 from app.services.naugold_client import NaugoldClient
+from app.services.price_tick import BroadcastTick
 from app.services.data_processor import DataProcessor
 from app.services.eodhd_mssql_writer import EODHDMSSQLWriter
+from app.services.http_session import get_http_session
 from app.config import get_settings
 from app.utils.logger import app_logger as logger
 
 # Korean Standard Time (UTC+9)
-KST = timezone(timedelta(hours=9))
+KST_OFFSET = timedelta(hours=9)
+KST = timezone(KST_OFFSET)
+
+
+def _as_float(value) -> float:
+    """float(value), skipping the call when value is already a float"""
+    return value if type(value) is float else float(value)
 
 
 class WebSocketManager:
@@ -35,10 +46,13 @@ class WebSocketManager:
             ),
         ]
 
-        # HTTP polling clients
+        # HTTP polling clients share one connection pool (closed on app shutdown)
+        http_session = get_http_session()
+
         self.twelve_data_client = TwelveDataClient(
             api_key=settings.TWELVE_DATA_API_KEY,
-            callback=self._handle_message
+            callback=self._handle_message,
+            session=http_session
         )
 
         # NauGold HTTP polling client (replaces Massive MSSQL)
@@ -51,59 +65,133 @@ class WebSocketManager:
             api_key=settings.EODHD_API_KEY,
             callback=self._handle_message,
             poll_interval=settings.EODHD_REALTIME_INTERVAL,
+            session=http_session,
         )
 
-        # SSE broadcast queues
-        self.broadcast_queues: List[asyncio.Queue] = []
+        # SSE fan-out: one shared ring of (seq, SSE frame) read by every client
+        # via its own cursor, plus an event that wakes waiting clients
+        self._ring: deque = deque(maxlen=settings.SSE_QUEUE_SIZE)
+        self._seq = 0
+        self._publish_event = asyncio.Event()
+        self.sse_client_count = 0
+
+        # Source timestamp -> KST isoformat string (bursts often repeat a timestamp)
+        self._ts_cache: Dict[datetime, str] = {}
+        self._ts_cache_max = 1024
 
         # EODHD data buffer for averaging (3 second intervals)
-        self.eodhd_buffer: Dict[str, List[Dict[str, Any]]] = {}
+        # asset_type -> running sum/count accumulator (see _new_accumulator)
+        self.eodhd_buffer: Dict[str, Dict[str, Any]] = {}
         self.eodhd_flush_interval = settings.PRICE_UPDATE_INTERVAL  # 3 seconds
         self.eodhd_flush_task = None
 
         # Massive data buffer for averaging (3 second intervals)
-        self.massive_buffer: Dict[str, List[Dict[str, Any]]] = {}
+        self.massive_buffer: Dict[str, Dict[str, Any]] = {}
         self.massive_flush_task = None
 
         # EODHD → MSSQL writer (for goldbef.com mobile app)
         self.mssql_writer = EODHDMSSQLWriter() if settings.MSSQL_WRITE_ENABLED else None
 
+    @staticmethod
+    def _new_accumulator() -> Dict[str, Any]:
+        """Empty running sum/count accumulator for one asset"""
+        return {
+            'price_sum': 0.0, 'price_n': 0,
+            'bid_sum': 0.0, 'bid_n': 0,
+            'ask_sum': 0.0, 'ask_n': 0,
+            'last_volume': None,
+            'last_ts': None,
+            'last_ts_ms': None,
+        }
+
+    def _accumulate(self, buffer: Dict[str, Dict[str, Any]], asset_type: Optional[str],
+                    price: Optional[float], bid: Optional[float], ask: Optional[float],
+                    volume: Optional[float], timestamp: Optional[datetime],
+                    timestamp_ms: Optional[int] = None):
+        """Add a tick to the asset's accumulator (the tick itself is not retained)"""
+        if not asset_type:
+            return
+
+        acc = buffer.get(asset_type)
+        if acc is None:
+            acc = buffer[asset_type] = self._new_accumulator()
+
+        if price:
+            acc['price_sum'] += price
+            acc['price_n'] += 1
+        if bid:
+            acc['bid_sum'] += bid
+            acc['bid_n'] += 1
+        if ask:
+            acc['ask_sum'] += ask
+            acc['ask_n'] += 1
+
+        acc['last_volume'] = volume
+        acc['last_ts'] = timestamp
+        acc['last_ts_ms'] = timestamp_ms
+
     async def _handle_eodhd_message(self, data: Dict[str, Any]):
         """
         Handle EODHD message - buffer for averaging
         """
         try:
-            asset_type = data.get('asset_type')
-            if not asset_type:
-                return
-
-            # Add to buffer
-            if asset_type not in self.eodhd_buffer:
-                self.eodhd_buffer[asset_type] = []
-
-            self.eodhd_buffer[asset_type].append(data)
+            self._accumulate(
+                self.eodhd_buffer, data.get('asset_type'),
+                data.get('price'), data.get('bid'), data.get('ask'),
+                data.get('volume'), data.get('timestamp'), data.get('timestamp_ms')
+            )
 
         except Exception as e:
             logger.error(f"Error buffering EODHD message: {e}")
 
     async def _handle_massive_message(self, data: Dict[str, Any]):
         """
-        Handle Massive MSSQL message - buffer for averaging
+        Handle NauGold message - buffer for averaging
         """
         try:
-            asset_type = data.get('asset_type')
-            if not asset_type:
-                return
-
-            # Add to buffer
-            if asset_type not in self.massive_buffer:
-                self.massive_buffer[asset_type] = []
-
-            self.massive_buffer[asset_type].append(data)
+            self._accumulate(
+                self.massive_buffer, data.get('asset_type'),
+                data.get('price'), data.get('bid'), data.get('ask'),
+                data.get('volume'), data.get('timestamp')
+            )
 
         except Exception as e:
             logger.error(f"Error buffering Massive message: {e}")
 
+    @staticmethod
+    def _tick_timestamp(ts_ms: Optional[float], timestamp: Optional[datetime]):
+        """Timestamp of the last accumulated tick (WS clients send raw epoch ms)"""
+        if ts_ms:
+            return datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc)
+        return timestamp
+
+    def _drain_accumulator(self, provider: str, asset_type: str,
+                           acc: Dict[str, Any]) -> Dict[str, Any]:
+        """Averaged price record for an accumulator, resetting it for the next interval"""
+        price_n = acc['price_n']
+        bid_n = acc['bid_n']
+        ask_n = acc['ask_n']
+
+        avg_data = {
+            'provider': provider,
+            'asset_type': asset_type,
+            'price': acc['price_sum'] / price_n,
+            'bid': acc['bid_sum'] / bid_n if bid_n else None,
+            'ask': acc['ask_sum'] / ask_n if ask_n else None,
+            'volume': acc['last_volume'],
+        }
+        ts_ms = acc['last_ts_ms']
+        timestamp = acc['last_ts']
+
+        # Reset before the timestamp conversion so a bad value can't leave
+        # the accumulator stuck for the next interval
+        acc['price_sum'] = acc['bid_sum'] = acc['ask_sum'] = 0.0
+        acc['price_n'] = acc['bid_n'] = acc['ask_n'] = 0
+        acc['last_volume'] = acc['last_ts'] = acc['last_ts_ms'] = None
+
+        avg_data['timestamp'] = self._tick_timestamp(ts_ms, timestamp)
+        return avg_data
+
     async def _flush_eodhd_buffer(self):
         """
         Periodically flush EODHD buffer with averaged values (batch save)
@@ -113,35 +201,23 @@ class WebSocketManager:
                 await asyncio.sleep(self.eodhd_flush_interval)
 
                 batch = []
-                for asset_type, data_list in list(self.eodhd_buffer.items()):
-                    if not data_list:
+                for asset_type, acc in list(self.eodhd_buffer.items()):
+                    samples = acc['price_n']
+                    if not samples:
                         continue
 
-                    # Calculate averages
-                    prices = [d['price'] for d in data_list if d.get('price')]
-                    bids = [d['bid'] for d in data_list if d.get('bid')]
-                    asks = [d['ask'] for d in data_list if d.get('ask')]
-
-                    if not prices:
+                    # Averages from the running sums (resets the accumulator);
+                    # one bad asset must not abort the rest of the batch
+                    try:
+                        avg_data = self._drain_accumulator('eodhd', asset_type, acc)
+                    except Exception as e:
+                        logger.error(f"[eodhd] Dropped {samples} samples for {asset_type}: {e}")
                         continue
 
-                    avg_data = {
-                        'provider': 'eodhd',
-                        'asset_type': asset_type,
-                        'price': sum(prices) / len(prices),
-                        'bid': sum(bids) / len(bids) if bids else None,
-                        'ask': sum(asks) / len(asks) if asks else None,
-                        'volume': data_list[-1].get('volume'),
-                        'timestamp': data_list[-1].get('timestamp'),
-                    }
-
                     batch.append(avg_data)
                     await self._broadcast_to_sse_clients(avg_data)
 
-                    logger.debug(f"[eodhd] Flushed {len(data_list)} samples for {asset_type}, avg price: {avg_data['price']:.4f}")
-
-                    # Clear buffer for this asset
-                    self.eodhd_buffer[asset_type] = []
+                    logger.debug(f"[eodhd] Flushed {samples} samples for {asset_type}, avg price: {avg_data['price']:.4f}")
 
                 # Batch save all averaged data in single transaction
                 if batch:
@@ -168,35 +244,18 @@ class WebSocketManager:
                 await asyncio.sleep(self.eodhd_flush_interval)  # Same interval as EODHD
 
                 batch = []
-                for asset_type, data_list in list(self.massive_buffer.items()):
-                    if not data_list:
-                        continue
-
-                    # Calculate averages
-                    prices = [d['price'] for d in data_list if d.get('price')]
-                    bids = [d['bid'] for d in data_list if d.get('bid')]
-                    asks = [d['ask'] for d in data_list if d.get('ask')]
-
-                    if not prices:
+                for asset_type, acc in list(self.massive_buffer.items()):
+                    samples = acc['price_n']
+                    if not samples:
                         continue
 
-                    avg_data = {
-                        'provider': 'massive',
-                        'asset_type': asset_type,
-                        'price': sum(prices) / len(prices),
-                        'bid': sum(bids) / len(bids) if bids else None,
-                        'ask': sum(asks) / len(asks) if asks else None,
-                        'volume': data_list[-1].get('volume'),
-                        'timestamp': data_list[-1].get('timestamp'),
-                    }
+                    # Averages from the running sums (resets the accumulator)
+                    avg_data = self._drain_accumulator('massive', asset_type, acc)
 
                     batch.append(avg_data)
                     await self._broadcast_to_sse_clients(avg_data)
 
-                    logger.debug(f"[massive] Flushed {len(data_list)} samples for {asset_type}, avg price: {avg_data['price']:.4f}")
-
-                    # Clear buffer for this asset
-                    self.massive_buffer[asset_type] = []
+                    logger.debug(f"[massive] Flushed {samples} samples for {asset_type}, avg price: {avg_data['price']:.4f}")
 
                 # Batch save all averaged data in single transaction
                 if batch:
@@ -224,54 +283,74 @@ class WebSocketManager:
         except Exception as e:
             logger.error(f"Error handling message: {e}")
 
+    def _kst_isoformat(self, timestamp: datetime) -> str:
+        """KST isoformat string for a timestamp (memoized, oldest entry evicted first)"""
+        # Keyed by the datetime itself: exact to the microsecond, and naive
+        # and aware values never compare equal
+        cached = self._ts_cache.get(timestamp)
+        if cached is not None:
+            return cached
+
+        if timestamp.tzinfo is None:
+            # Assume UTC if no timezone info: KST is a fixed offset,
+            # so shift directly instead of attaching UTC and converting
+            timestamp_kst = (timestamp + KST_OFFSET).replace(tzinfo=KST)
+        else:
+            # Convert to KST
+            timestamp_kst = timestamp.astimezone(KST)
+        timestamp_str = timestamp_kst.isoformat()
+
+        if len(self._ts_cache) >= self._ts_cache_max:
+            del self._ts_cache[next(iter(self._ts_cache))]
+        self._ts_cache[timestamp] = timestamp_str
+        return timestamp_str
+
     async def _broadcast_to_sse_clients(self, data: Dict[str, Any]):
         """Send data to all connected SSE clients"""
-        if not self.broadcast_queues:
+        if not self.sse_client_count:
             return
 
         # Convert timestamp to Korean Standard Time (KST)
         timestamp = data.get('timestamp')
         if timestamp:
-            if timestamp.tzinfo is None:
-                # Assume UTC if no timezone info
-                timestamp = timestamp.replace(tzinfo=timezone.utc)
-            # Convert to KST
-            timestamp_kst = timestamp.astimezone(KST)
-            timestamp_str = timestamp_kst.isoformat()
+            timestamp_str = self._kst_isoformat(timestamp)
         else:
             # Use current KST time if no timestamp provided
             timestamp_str = datetime.now(KST).isoformat()
 
-        # Prepare data for JSON serialization
-        broadcast_data = {
-            'provider': data['provider'],
-            'asset_type': data['asset_type'],
-            'price': float(data['price']),
-            'bid': float(data['bid']) if data.get('bid') else None,
-            'ask': float(data['ask']) if data.get('ask') else None,
-            'volume': float(data['volume']) if data.get('volume') else None,
-            'timestamp': timestamp_str
-        }
+        # Prepare data for JSON serialization (values are usually floats already)
+        bid = data.get('bid')
+        ask = data.get('ask')
+        volume = data.get('volume')
+        broadcast_data = BroadcastTick(
+            data['provider'],
+            data['asset_type'],
+            _as_float(data['price']),
+            _as_float(bid) if bid else None,
+            _as_float(ask) if ask else None,
+            _as_float(volume) if volume else None,
+            timestamp_str,
+        )
 
-        # Include change/change_p from metadata (EODHD REST-polled assets)
+        # Include change/change_p from metadata (EODHD REST-polled assets);
+        # only these rarer payloads fall back to a dict
         metadata = data.get('metadata')
-        if metadata:
+        if metadata and ('change' in metadata or 'change_p' in metadata):
+            broadcast_data = broadcast_data.to_dict()
             if 'change' in metadata:
-                broadcast_data['change'] = float(metadata['change'])
+                broadcast_data['change'] = _as_float(metadata['change'])
             if 'change_p' in metadata:
-                broadcast_data['change_p'] = float(metadata['change_p'])
+                broadcast_data['change_p'] = _as_float(metadata['change_p'])
 
-        # Send to all queues
-        for queue in self.broadcast_queues[:]:  # Copy list to avoid modification during iteration
-            try:
-                queue.put_nowait(broadcast_data)
-            except asyncio.QueueFull:
-                # Queue is full, try to remove oldest item and add new one
-                try:
-                    queue.get_nowait()
-                    queue.put_nowait(broadcast_data)
-                except:
-                    logger.warning("Failed to add data to full queue")
+        # Serialize once for all clients, then publish the ready-to-send SSE
+        # frame to the shared ring (oldest entry drops when full)
+        frame = b"data: " + orjson.dumps(broadcast_data) + b"\n\n"
+        self._seq += 1
+        self._ring.append((self._seq, frame))
+
+        # Wake every waiting client; clients that are busy catch up via their cursor
+        self._publish_event.set()
+        self._publish_event.clear()
 
     async def start(self):
         """Start all data clients"""
@@ -300,21 +379,21 @@ class WebSocketManager:
         """Stop all data clients"""
         logger.info("Stopping WebSocket Manager")
 
-        # Stop EODHD buffer flush task
-        if self.eodhd_flush_task:
-            self.eodhd_flush_task.cancel()
+        # Stop EODHD and Massive buffer flush tasks concurrently (bounded wait)
+        flush_tasks = [
+            task for task in (self.eodhd_flush_task, self.massive_flush_task)
+            if task
+        ]
+        for task in flush_tasks:
+            task.cancel()
+        if flush_tasks:
             try:
-                await self.eodhd_flush_task
-            except asyncio.CancelledError:
-                pass
-
-        # Stop Massive buffer flush task
-        if self.massive_flush_task:
-            self.massive_flush_task.cancel()
-            try:
-                await self.massive_flush_task
-            except asyncio.CancelledError:
-                pass
+                await asyncio.wait_for(
+                    asyncio.gather(*flush_tasks, return_exceptions=True),
+                    timeout=2.0
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Timed out waiting for buffer flush tasks to stop")
 
         # Stop WebSocket clients
         ws_tasks = [client.stop() for client in self.ws_clients]
@@ -330,16 +409,45 @@ class WebSocketManager:
         if self.mssql_writer:
             self.mssql_writer.close()
 
-    def add_sse_client(self, queue: asyncio.Queue):
-        """Register a new SSE client"""
-        self.broadcast_queues.append(queue)
-        logger.info(f"SSE client connected (total: {len(self.broadcast_queues)})")
+    def add_sse_client(self) -> int:
+        """
+        Register a new SSE client
 
-    def remove_sse_client(self, queue: asyncio.Queue):
+        Returns:
+            Initial cursor (only updates published after this are delivered)
+        """
+        self.sse_client_count += 1
+        logger.info(f"SSE client connected (total: {self.sse_client_count})")
+        return self._seq
+
+    def remove_sse_client(self):
         """Unregister an SSE client"""
-        if queue in self.broadcast_queues:
-            self.broadcast_queues.remove(queue)
-            logger.info(f"SSE client disconnected (total: {len(self.broadcast_queues)})")
+        if self.sse_client_count > 0:
+            self.sse_client_count -= 1
+            logger.info(f"SSE client disconnected (total: {self.sse_client_count})")
+
+    def get_broadcasts_since(self, cursor: int) -> Tuple[List[bytes], int]:
+        """
+        Get SSE frames published after cursor
+
+        Clients that fell more than the ring size behind skip the dropped entries.
+
+        Returns:
+            (frames, new cursor)
+        """
+        if not self._ring or self._seq <= cursor:
+            return [], cursor
+
+        first_seq = self._ring[0][0]
+        start = max(0, cursor + 1 - first_seq)
+        return [frame for _, frame in islice(self._ring, start, None)], self._seq
+
+    async def wait_for_broadcast(self, cursor: int):
+        """Wait until an update newer than cursor is published"""
+        # Checked inside the waiting task so a publish that lands before
+        # the wait starts is not missed
+        while self._seq <= cursor:
+            await self._publish_event.wait()
 
     def get_client_status(self) -> Dict[str, bool]:
         """Get connection status of all clients"""
@@ -10,12 +10,16 @@ def setup_logger():
     # Remove default logger
     logger.remove()
 
+    # Sinks use enqueue=True: records are written by a background worker,
+    # so logging from hot paths never blocks the event loop on I/O
+
     # Add console logger
     logger.add(
         sys.stdout,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         level=settings.LOG_LEVEL,
-        colorize=True
+        colorize=True,
+        enqueue=True
     )
 
     # Add file logger
@@ -24,7 +28,8 @@ def setup_logger():
         rotation="1 day",
         retention="7 days",
         level=settings.LOG_LEVEL,
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        enqueue=True
     )
 
     return logger